@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers shared by the devices that drive one motor bus per arm."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+
+import numpy as np
+
+from lerobot.errors import DeviceNotConnectedError
+
+from .motors_bus import MotorCalibration, MotorsBus
+
+logger = logging.getLogger(__name__)
+
+
+def split_calibration(
+    calibration: dict[str, MotorCalibration], prefixes: Iterable[str]
+) -> tuple[dict[str, MotorCalibration], ...]:
+    """
+    Splits a calibration keyed by `<prefix>_<motor>` into one dict per prefix, keyed by motor name.
+    Keys with any other prefix (e.g. from a single arm calibration file) are skipped.
+    """
+    split = {prefix: {} for prefix in prefixes}
+    for key, calib in calibration.items():
+        prefix, _, motor = key.partition("_")
+        if prefix in split:
+            split[prefix][motor] = calib
+    return tuple(split.values())
+
+
+def check_registers(bus: MotorsBus, registers: dict[str, int]) -> None:
+    """
+    Reads back registers set with `sync_write` and raises if any motor doesn't hold the expected value.
+    SYNC_WRITE gets no status packet back, so a lost packet would otherwise leave a motor misconfigured.
+    """
+    for data_name, value in registers.items():
+        mismatched = {motor: val for motor, val in bus.sync_read(data_name).items() if val != value}
+        if mismatched:
+            raise RuntimeError(
+                f"Failed to set {data_name}={value} on {bus.port}, motors read back: {mismatched}"
+            )
+
+
+class BusReader:
+    """
+    Polls `Present_Position` of a bus from a background thread, keeping the latest snapshot as a float32
+    vector in motor order. Any other access to the bus must hold `lock`, as the serial port is shared.
+    """
+
+    def __init__(self, bus: MotorsBus, name: str):
+        self.bus = bus
+        self.name = name
+        self.motors = tuple(bus.motors)
+        self.lock = threading.Lock()
+        # Rebound on each poll rather than updated in place, so readers never see a partial snapshot
+        self.latest = np.zeros(len(self.motors), dtype=np.float32)
+        # time.monotonic() at which the oldest motor of `latest` was read: with partial reads a poll only
+        # refreshes some motors, so a snapshot is as old as its oldest motor reading.
+        self.latest_ts = 0.0
+        self.error: Exception | None = None  # error of the last failed poll
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, partial_read_size: int | None = None) -> None:
+        """Starts polling. With `partial_read_size`, each poll only reads that many of the stalest motors."""
+        if partial_read_size is not None:
+            partial_read_size = min(partial_read_size, len(self.motors))
+        self.latest = np.zeros(len(self.motors), dtype=np.float32)
+        self.latest_ts = 0.0
+        self.error = None
+        self._ready.clear()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._poll,
+            args=(self._stop_event, partial_read_size),
+            name=f"{self.name} reader",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def wait_ready(self, timeout: float = 2.0) -> None:
+        """Waits for the first snapshot."""
+        if not self._ready.wait(timeout=timeout):
+            raise TimeoutError(f"{self.name}: Timed out waiting for state after {timeout}s.")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def release(self, disable_torque: bool = True) -> None:
+        """Stops polling and disconnects the bus if it is connected, only logging errors."""
+        self.stop()
+        if self.bus.is_connected:
+            try:
+                self.bus.disconnect(disable_torque)
+            except Exception as e:
+                logger.warning(f"Error disconnecting {self.name}: {e}")
+
+    def check_fresh(self, max_age_s: float) -> None:
+        """Raises ConnectionError if polling stopped or the snapshot is older than `max_age_s`."""
+        if not self.is_running:
+            raise ConnectionError(f"{self.name}: background reader stopped.") from self.error
+        age = time.monotonic() - self.latest_ts
+        if age > max_age_s:
+            message = f"{self.name}: state is {age:.2f}s old (last error: {self.error})."
+            raise ConnectionError(message) from self.error
+
+    def read(self) -> np.ndarray:
+        """Reads every motor right away, in between two polls."""
+        with self.lock:
+            positions = self.bus.sync_read("Present_Position")
+        return np.fromiter(map(positions.__getitem__, self.motors), dtype=np.float32, count=len(self.motors))
+
+    def _poll(self, stop_event: threading.Event, read_size: int | None) -> None:
+        """
+        Picks the motors to read by age weighted by their last move, so idle ones are still refreshed.
+        Stops on DeviceNotConnectedError, retries other errors with an exponential backoff.
+        """
+        motor_index = {motor: idx for idx, motor in enumerate(self.motors)}
+        last_update = np.zeros(len(self.motors))
+        last_delta = np.zeros(len(self.motors), dtype=np.float32)
+        n_errors, last_warning = 0, 0.0
+
+        # Waiting between polls lets other callers grab the bus lock and makes shutdown prompt.
+        while not stop_event.wait(timeout=0.001):
+            to_read = None  # every motor
+            if read_size is not None and self._ready.is_set():
+                priority = (time.monotonic() - last_update) * (np.abs(last_delta) + 1.0)
+                to_read = [self.motors[idx] for idx in np.argsort(-priority)[:read_size]]
+
+            try:
+                with self.lock:
+                    positions = self.bus.sync_read("Present_Position", to_read)
+            except DeviceNotConnectedError as e:
+                self.error = e
+                logger.warning(f"{self.name} is not connected, stopping its background reader.")
+                break
+            except Exception as e:
+                self.error = e
+                n_errors += 1
+                if time.monotonic() - last_warning >= 1.0:
+                    logger.warning(f"Error reading {self.name} in background ({n_errors} in a row): {e}")
+                    last_warning = time.monotonic()
+                stop_event.wait(timeout=min(0.001 * 2**n_errors, 0.1))
+                continue
+
+            n_errors = 0
+            self.error = None
+            idx = [motor_index[motor] for motor in positions]
+            values = np.fromiter(positions.values(), dtype=np.float32, count=len(positions))
+            now = time.monotonic()
+            if self._ready.is_set():
+                last_delta[idx] = values - self.latest[idx]
+            last_update[idx] = now
+
+            snapshot = self.latest.copy()
+            snapshot[idx] = values
+            self.latest = snapshot
+            self.latest_ts = float(last_update.min())
+            self._ready.set()
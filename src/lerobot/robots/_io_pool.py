@@ -0,0 +1,49 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide thread pool for short blocking device I/O (bus transactions, camera reads)."""
+
+import atexit
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Minimum size, enough for a teleop session: two buses on the robot, two on the teleoperator, four cameras.
+DEFAULT_WORKERS = 2 + 2 + 4
+
+_pool: ThreadPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_pool(min_workers: int = DEFAULT_WORKERS) -> ThreadPoolExecutor:
+    """
+    Returns the shared I/O pool, creating it with at least `min_workers` threads on first use.
+    It is shut down when the interpreter exits.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None:
+            _pool_workers = max(DEFAULT_WORKERS, min_workers)
+            _pool = ThreadPoolExecutor(max_workers=_pool_workers, thread_name_prefix="device_io")
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        elif min_workers > _pool_workers:
+            # The pool can't grow once created: the extra I/O just queues up behind the running tasks.
+            logger.warning(
+                f"Shared I/O pool has {_pool_workers} workers but {min_workers} were requested, "
+                "some device I/O will wait for a free worker."
+            )
+    return _pool
@@ -37,9 +37,23 @@ class DualScorpionFollowerConfig(RobotConfig):
     # Set this to a positive scalar to have the same value for all motors, or a list that is the same length as
     # the number of motors in your follower arms.
     max_relative_target: int | None = None
+    # When clipping with `max_relative_target`, present positions polled in the background less than
+    # `present_reuse_s` seconds ago are used as is instead of reading both buses again.
+    present_reuse_s: float = 0.02
+
+    # Background reading of the arm buses (see `lerobot.motors.bus_reader.BusReader`): motors read per poll
+    # (`None` for all of them), and how old the arm state may get before reading it raises.
+    partial_read_size: int | None = None
+    max_state_age_s: float = 0.5
 
     # cameras
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
 
     # Set to `True` for backward compatibility with previous policies/dataset
     use_degrees: bool = False
+
+    def __post_init__(self):
+        super().__post_init__()
+        # Values above the number of motors read them all / モーター数を超える値は全モーター読み取りと同じ
+        if self.partial_read_size is not None and self.partial_read_size < 1:
+            raise ValueError(f"partial_read_size must be at least 1, got {self.partial_read_size}.")
@@ -16,24 +16,39 @@
 # limitations under the License.
 
 import logging
+import math
+import threading
 import time
-from functools import cached_property
+from collections.abc import Callable, Mapping
+from pprint import pformat
+from queue import Empty
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
+from lerobot.motors.bus_reader import BusReader, check_registers, split_calibration
 from lerobot.motors.feetech import (
     FeetechMotorsBus,
     OperatingMode,
 )
+from lerobot.utils.queue import LatestSlot
 
+from .._io_pool import get_pool
 from ..robot import Robot
-from ..utils import ensure_safe_goal_position
 from .config_dual_scorpion_follower import DualScorpionFollowerConfig
 
 logger = logging.getLogger(__name__)
 
+
+def _call_locked(lock: threading.Lock, fn: Callable, *args) -> Any:
+    with lock:
+        return fn(*args)
+
+
 class DualScorpionFollower(Robot):
     """
     SO-101 Dual Follower Arm
@@ -48,21 +63,14 @@ class DualScorpionFollower(Robot):
         """
         super().__init__(config)
         self.config = config
+        # Rendered once so the per-tick debug logs don't go through __str__ / デバッグログ用に名前を事前生成
+        self._name_repr = str(self)
         norm_mode_body = MotorNormMode.DEGREES if config.use_degrees else MotorNormMode.RANGE_M100_100
 
         # Separate calibration data for right and left arms / キャリブレーションデータを右腕と左腕用に分離
-        # "right_"で始まるモーターのキャリブレーションデータのみ抽出
-        right_calibration = {
-            motor.replace("right_", ""): calib 
-            for motor, calib in self.calibration.items() 
-            if motor.startswith("right_")
-        }
-        # "left_"で始まるモーターのキャリブレーションデータのみ抽出
-        left_calibration = {  
-            motor.replace("left_", ""): calib 
-            for motor, calib in self.calibration.items() 
-            if motor.startswith("left_")
-        }
+        self._right_calibration, self._left_calibration = split_calibration(
+            self.calibration, ("right", "left")
+        )
 
         # Initialize right follower motors / 右腕のモーターバスの初期化
         self.right_bus = FeetechMotorsBus(
@@ -77,7 +85,7 @@ class DualScorpionFollower(Robot):
                 "joint6": Motor(7, "sts3215", norm_mode_body),
                 "gripper": Motor(8, "sts3215", MotorNormMode.RANGE_0_100),
             },
-            calibration=right_calibration,
+            calibration=self._right_calibration,
         )
         # Initialize left follower motors / 左腕のモーターバスの初期化
         self.left_bus = FeetechMotorsBus(
@@ -92,31 +100,78 @@ class DualScorpionFollower(Robot):
                 "joint6": Motor(7, "sts3215", norm_mode_body),
                 "gripper": Motor(8, "sts3215", MotorNormMode.RANGE_0_100),
             },
-            calibration=left_calibration,
+            calibration=self._left_calibration,
         )
+        # The motor layout is fixed after construction, so the prefixed feature keys are built once.
+        # モーター構成は固定のため、接頭辞付きのキーを事前に作成しておく
+        self._right_motors = tuple(self.right_bus.motors)
+        self._left_motors = tuple(self.left_bus.motors)
+        self._right_pos_keys = tuple(f"right_{motor}.pos" for motor in self._right_motors)
+        self._left_pos_keys = tuple(f"left_{motor}.pos" for motor in self._left_motors)
+        # Maps each action key to the arm it drives and the motor's index in that arm, e.g.
+        # "right_joint3.pos" -> ("right", 3)
+        self._action_key_route = {
+            key: (side, idx)
+            for side, keys in (("right", self._right_pos_keys), ("left", self._left_pos_keys))
+            for idx, key in enumerate(keys)
+        }
+
         # Initialize cameras / カメラの初期化
         self.cameras = make_cameras_from_configs(config.cameras)
 
+        # Motors and cameras are fixed after construction: expose their features as read-only views built once
+        # モーターとカメラの構成は固定のため、特徴量は読み取り専用のビューとして一度だけ作成する
+        self._motors_ft_frozen = MappingProxyType(
+            dict.fromkeys(self._right_pos_keys + self._left_pos_keys, float)
+        )
+        self._cameras_ft_frozen = MappingProxyType(
+            {
+                cam: (self.config.cameras[cam].height, self.config.cameras[cam].width, 3)
+                for cam in self.cameras
+            }
+        )
+        self._observation_ft_frozen = MappingProxyType({**self._motors_ft_frozen, **self._cameras_ft_frozen})
+
+        # The two arms sit on independent serial ports, so their transactions can overlap.
+        # 左右のアームは別々のシリアルポートに接続されているため、通信を並列に実行する
+        # The pool is shared process-wide, so devices don't each keep their own set of idle threads.
+        # It needs one worker per bus and per camera / バスとカメラごとに1スレッドが必要
+        self._io_pool = get_pool(2 + len(self.cameras))
+
+        # Present positions are polled by one background reader per bus / 現在位置はバスごとに別スレッドで読み取る
+        self._readers = {
+            "right": BusReader(self.right_bus, f"{self} right arm"),
+            "left": BusReader(self.left_bus, f"{self} left arm"),
+        }
+
+        # Actions put into the slot returned by `start_action_sender` are sent by a background thread.
+        # When the motors are slower than the producer, only the latest action is sent.
+        # スロットに置かれたアクションはバックグラウンドスレッドが送信し、常に最新のものだけを送る
+        self._action_slot = LatestSlot()
+        self._sender_lock = threading.Lock()  # so concurrent callers never start two senders
+        self._sender_stop_event: threading.Event | None = None
+        self._sender_thread: threading.Thread | None = None
+
+        # Connection and calibration status only change through connect/calibrate/disconnect, so they are
+        # tracked here rather than queried from every bus and camera on each call.
+        self._connected = False
+        self._calibrated: bool | None = None  # unknown until read from the motors on connect
+
     @property
-    def _motors_ft(self) -> dict[str, type]:
-        ft = {}
-        ft.update({f"right_{motor}.pos": float for motor in self.right_bus.motors})
-        ft.update({f"left_{motor}.pos": float for motor in self.left_bus.motors})
-        return ft
+    def _motors_ft(self) -> Mapping[str, type]:
+        return self._motors_ft_frozen
     
     @property
-    def _cameras_ft(self) -> dict[str, tuple]:
-        return {
-            cam: (self.config.cameras[cam].height, self.config.cameras[cam].width, 3) for cam in self.cameras
-        }
+    def _cameras_ft(self) -> Mapping[str, tuple]:
+        return self._cameras_ft_frozen
     
-    @cached_property
-    def observation_features(self) -> dict[str, type | tuple]:
-        return {**self._motors_ft, **self._cameras_ft}
+    @property
+    def observation_features(self) -> Mapping[str, type | tuple]:
+        return self._observation_ft_frozen
     
-    @cached_property
-    def action_features(self) -> dict[str, type]:
-        return self._motors_ft
+    @property
+    def action_features(self) -> Mapping[str, type]:
+        return self._motors_ft_frozen
     
     @property
     def is_connected(self) -> bool:
@@ -124,9 +179,7 @@ class DualScorpionFollower(Robot):
         Check if the devices is connected.
         デバイスが接続されているかを確認する
         """
-        return self.right_bus.is_connected and \
-            self.left_bus.is_connected and \
-            all(cam.is_connected for cam in self.cameras.values())
+        return self._connected
     
     def connect(self, calibrate: bool = True) -> None:
         """
@@ -138,96 +191,121 @@ class DualScorpionFollower(Robot):
         if self.is_connected:  # すでに接続されている場合はエラーを投げる
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
-        self.right_bus.connect()  # 右腕のモーターバスを接続
-        self.left_bus.connect()  # 左腕のモーターバスを接続
+        try:
+            self.right_bus.connect()  # 右腕のモーターバスを接続
+            self.left_bus.connect()  # 左腕のモーターバスを接続
+
+            if not self.is_calibrated and calibrate:  # キャリブレーションが必要な場合は実行
+                self.calibrate()
 
-        if not self.is_calibrated and calibrate:  # キャリブレーションが必要な場合は実行
-            self.calibrate()
+            for cam in self.cameras.values():  # カメラを接続
+                cam.connect()
 
-        for cam in self.cameras.values():  # カメラを接続
-            cam.connect()
+            self.configure()
+            for reader in self._readers.values():
+                reader.start(self.config.partial_read_size)
+            for reader in self._readers.values():
+                reader.wait_ready()
+        except BaseException:
+            # `disconnect` can't be called while not connected, so release what did connect here
+            # 接続に失敗した場合は、接続済みのデバイスとスレッドを解放してから例外を再送出する
+            self._release_partial_connection()
+            raise
 
-        self.configure()
+        self._connected = True
         logger.info(f"{self} connected.")
 
+    def _release_partial_connection(self) -> None:
+        """
+        Release whatever a failed `connect` did connect.
+        接続に失敗した際に、接続済みのバス・カメラとスレッドを解放する
+        """
+        for reader in self._readers.values():
+            reader.release(self.config.disable_torque_on_disconnect)
+        for cam_key, cam in self.cameras.items():
+            if cam.is_connected:
+                try:
+                    cam.disconnect()
+                except Exception as e:
+                    logger.warning(f"Error disconnecting {cam_key} after a failed connect of {self}: {e}")
+        self._calibrated = None
+
     @property
     def is_calibrated(self) -> bool:
         """
         Check if the arms is calibrated.
         アームがキャリブレーションされているかどうかを確認する
         """
-        return self.right_bus.is_calibrated and self.left_bus.is_calibrated
+        if self._calibrated is None:
+            self._calibrated = self.right_bus.is_calibrated and self.left_bus.is_calibrated
+        return self._calibrated
     
     def calibrate(self) -> None:
         """
         Run the calibration for both arms.
         キャリブレーションを実行する
         """
-        logger.info(f"\nRunning calibration of {self}")
-        self.right_bus.disable_torque()  # 右腕のトルクを無効にする
-        self.left_bus.disable_torque()  # 左腕のトルクを無効にする
-
-        for motor in self.right_bus.motors:
-            self.right_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-        for motor in self.left_bus.motors:
-            self.left_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-
-        self.calibration = {}
-
-        # Right arm calibration / 右腕のキャリブレーション
-        input(f"Move RIGHT {self} to the middle of its range of motion and press ENTER....")
-        right_homing_offsets = self.right_bus.set_half_turn_homings()
-        print(
-            "Move all joints sequentially through their entire ranges "
-            "and press ENTER when done with each joint."
-        )
-        right_range_mins, right_range_maxes = self.right_bus.record_ranges_of_motion()
-        for motor, m in self.right_bus.motors.items():
-            self.calibration[f"right_{motor}"] = MotorCalibration(
-                id=m.id,
-                drive_mode=0,
-                homing_offset=right_homing_offsets[motor],
-                range_min=right_range_mins[motor],
-                range_max=right_range_maxes[motor],
+        # Keep the background readers off the buses while calibrating / キャリブレーション中はバスを占有する
+        with self._readers["right"].lock, self._readers["left"].lock:
+            logger.info(f"\nRunning calibration of {self}")
+            self.right_bus.disable_torque()  # 右腕のトルクを無効にする
+            self.left_bus.disable_torque()  # 左腕のトルクを無効にする
+
+            self.right_bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
+            self.left_bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
+            check_registers(self.right_bus, {"Operating_Mode": OperatingMode.POSITION.value})
+            check_registers(self.left_bus, {"Operating_Mode": OperatingMode.POSITION.value})
+
+            self.calibration = {}
+            self._right_calibration, self._left_calibration = {}, {}
+
+            # Right arm calibration / 右腕のキャリブレーション
+            input(f"Move RIGHT {self} to the middle of its range of motion and press ENTER....")
+            right_homing_offsets = self.right_bus.set_half_turn_homings()
+            print(
+                "Move all joints sequentially through their entire ranges "
+                "and press ENTER when done with each joint."
             )
-
-        # Left arm calibration/ 左腕のキャリブレーション
-        input(f"Move LEFT {self} to the middle of its range of motion and press ENTER....")
-        left_homing_offsets = self.left_bus.set_half_turn_homings()
-        print(
-            "Move all joints sequentially through their entire ranges "
-            "and press ENTER when done with each joint."
-        )
-        left_range_mins, left_range_maxes = self.left_bus.record_ranges_of_motion()
-        for motor, m in self.left_bus.motors.items():
-            self.calibration[f"left_{motor}"] = MotorCalibration(
-                id=m.id,
-                drive_mode=0,
-                homing_offset=left_homing_offsets[motor],
-                range_min=left_range_mins[motor],
-                range_max=left_range_maxes[motor],
+            right_range_mins, right_range_maxes = self.right_bus.record_ranges_of_motion()
+            for motor, m in self.right_bus.motors.items():
+                calib = MotorCalibration(
+                    id=m.id,
+                    drive_mode=0,
+                    homing_offset=right_homing_offsets[motor],
+                    range_min=right_range_mins[motor],
+                    range_max=right_range_maxes[motor],
+                )
+                self.calibration[f"right_{motor}"] = calib
+                self._right_calibration[motor] = calib
+
+            # Left arm calibration/ 左腕のキャリブレーション
+            input(f"Move LEFT {self} to the middle of its range of motion and press ENTER....")
+            left_homing_offsets = self.left_bus.set_half_turn_homings()
+            print(
+                "Move all joints sequentially through their entire ranges "
+                "and press ENTER when done with each joint."
             )
-
-        # error:
-        # self.right_bus.write_calibration(self.calibration)
-        # self.left_bus.write_calibration(self.calibration)
-
-        # キャリブレーションを保存する前に、右腕と左腕のキャリブレーションデータを分ける必要がある
-        # Extract calibration data for the right arm / 右腕用のキャリブレーションデータを抽出
-        right_calibration = {
-            motor.replace("right_", ""): calib
-            for motor, calib in self.calibration.items()
-            if motor.startswith("right_")
-        }
-        # Extract calibration data for the left arm / 左腕用のキャリブレーションデータを抽出
-        left_calibration = {
-            motor.replace("left_", ""): calib
-            for motor, calib in self.calibration.items()
-            if motor.startswith("left_")
-        }
-        self.right_bus.write_calibration(right_calibration)
-        self.left_bus.write_calibration(left_calibration)
-
+            left_range_mins, left_range_maxes = self.left_bus.record_ranges_of_motion()
+            for motor, m in self.left_bus.motors.items():
+                calib = MotorCalibration(
+                    id=m.id,
+                    drive_mode=0,
+                    homing_offset=left_homing_offsets[motor],
+                    range_min=left_range_mins[motor],
+                    range_max=left_range_maxes[motor],
+                )
+                self.calibration[f"left_{motor}"] = calib
+                self._left_calibration[motor] = calib
+
+            # error:
+            # self.right_bus.write_calibration(self.calibration)
+            # self.left_bus.write_calibration(self.calibration)
+
+            # Each bus only takes the calibration of its own arm / 各バスには自分の腕のキャリブレーションのみを書き込む
+            self.right_bus.write_calibration(self._right_calibration)
+            self.left_bus.write_calibration(self._left_calibration)
+
+        self._calibrated = True
         self._save_calibration()  # キャリブレーションを保存
         print("Calibration saved to", self.calibration_fpath)
 
@@ -236,30 +314,36 @@ class DualScorpionFollower(Robot):
         Apply the motor settings for both arms.
         モーターの設定を適用する
         """
-        with self.right_bus.torque_disabled(), self.left_bus.torque_disabled():
+        with (
+            self._readers["right"].lock,
+            self._readers["left"].lock,
+            self.right_bus.torque_disabled(),
+            self.left_bus.torque_disabled(),
+        ):
             self.right_bus.configure_motors()
             self.left_bus.configure_motors()
-            for motor in self.right_bus.motors:
-                self.right_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
+            registers = {
+                "Operating_Mode": OperatingMode.POSITION.value,
                 # Set P_Coefficient to lower value to avoid shakiness (Default is 32)
-                self.right_bus.write("P_Coefficient", motor, 16)
+                "P_Coefficient": 16,
                 # Set I_Coefficient and D_Coefficient to default value 0 and 32
-                self.right_bus.write("I_Coefficient", motor, 0)
-                self.right_bus.write("D_Coefficient", motor, 32)
-            for motor in self.left_bus.motors:
-                self.left_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-                # Set P_Coefficient to lower value to avoid shakiness (Default is 32)
-                self.left_bus.write("P_Coefficient", motor, 16)
-                # Set I_Coefficient and D_Coefficient to default value 0 and 32
-                self.left_bus.write("I_Coefficient", motor, 0)
-                self.left_bus.write("D_Coefficient", motor, 32)
+                "I_Coefficient": 0,
+                "D_Coefficient": 32,
+            }
+            # One SYNC_WRITE per register addresses every motor of an arm in a single packet, then everything
+            # is read back once to catch a lost packet / 各レジスタを一括で書き込み、最後に一度だけ読み戻して確認する
+            for bus in (self.right_bus, self.left_bus):
+                for data_name, value in registers.items():
+                    bus.sync_write(data_name, value)
+            for bus in (self.right_bus, self.left_bus):
+                check_registers(bus, registers)
 
     def setup_motors(self) -> None:
-        for motor in reversed(self.right_bus.motors):
+        for motor in reversed(self._right_motors):
             input(f"Connect the controller board to the '{motor}' motor only and press enter.")
             self.right_bus.setup_motor(motor)
             print(f"'{motor}' motor id set to {self.right_bus.motors[motor].id}")
-        for motor in reversed(self.left_bus.motors):
+        for motor in reversed(self._left_motors):
             input(f"Connect the controller board to the '{motor}' motor only and press enter.")
             self.left_bus.setup_motor(motor)
             print(f"'{motor}' motor id set to {self.left_bus.motors[motor].id}")
@@ -267,31 +351,76 @@ class DualScorpionFollower(Robot):
     def get_observation(self) -> dict[str, Any]:
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected")
-        
-        # Read arm position
-        start = time.perf_counter()
-        right_obs_dict = self.right_bus.sync_read("Present_Position")
-        left_obs_dict = self.left_bus.sync_read("Present_Position")
+        for reader in self._readers.values():
+            reader.check_fresh(self.config.max_state_age_s)
 
-        # Add proper prefixes to match the expected feature names
-        right_obs_dict = {f"right_{motor}.pos": val for motor, val in right_obs_dict.items()}
-        left_obs_dict = {f"left_{motor}.pos": val for motor, val in left_obs_dict.items()}
+        # Capture camera images concurrently while picking up the latest arm positions.
+        # The timing is only taken when it will actually be logged.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            start_ns = time.monotonic_ns()
+        cam_futures = {cam_key: self._io_pool.submit(cam.async_read) for cam_key, cam in self.cameras.items()}
+        right_present_pos, left_present_pos = self._readers["right"].latest, self._readers["left"].latest
 
-        dt_ms = (time.perf_counter() - start) * 1e3
-        logger.debug(f"{self} read state: {dt_ms:.1f}ms")
+        # Fill both arm observations into one dict, under the expected (prefixed) feature names
+        obs_dict = dict(zip(self._right_pos_keys, right_present_pos.tolist(), strict=True))
+        obs_dict.update(zip(self._left_pos_keys, left_present_pos.tolist(), strict=True))
 
-        # Combine both arm observations
-        obs_dict = {**right_obs_dict, **left_obs_dict}
+        if debug:
+            logger.debug("%s read state: %.1fms", self._name_repr, (time.monotonic_ns() - start_ns) / 1e6)
 
-        # capture camera images
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+        for cam_key, future in cam_futures.items():
+            obs_dict[cam_key] = future.result()
+        if debug:
+            logger.debug("%s read cameras: %.1fms", self._name_repr, (time.monotonic_ns() - start_ns) / 1e6)
 
         return obs_dict
     
+    def _clip_goal_position(
+        self, goal: dict[str, np.ndarray], present_pos: dict[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        """
+        Clip the goal positions to `max_relative_target`, like `ensure_safe_goal_position`.
+        目標位置を現在位置から `max_relative_target` 以内に制限する
+        """
+        max_relative_target = self.config.max_relative_target
+        if isinstance(max_relative_target, dict):
+            # Keyed by motor name like "right_joint0", for the motors of the action only, as in
+            # `ensure_safe_goal_position`
+            goal_motors = {
+                keys[idx].removesuffix(".pos")
+                for side, keys in (("right", self._right_pos_keys), ("left", self._left_pos_keys))
+                for idx in np.flatnonzero(~np.isnan(goal[side]))
+            }
+            if set(max_relative_target) != goal_motors:
+                raise ValueError("max_relative_target keys must match those of goal_present_pos.")
+
+        safe_goal, warnings_dict = {}, {}
+        for side, keys in (("right", self._right_pos_keys), ("left", self._left_pos_keys)):
+            if isinstance(max_relative_target, dict):
+                # Motors without a goal stay NaN whatever their cap
+                max_diff = np.array(
+                    [max_relative_target.get(key.removesuffix(".pos"), np.inf) for key in keys],
+                    dtype=np.float32,
+                )
+            else:
+                max_diff = np.float32(max_relative_target)
+            present = present_pos[side]
+            safe_goal[side] = present + np.clip(goal[side] - present, -max_diff, max_diff)
+
+            for idx in np.flatnonzero(np.abs(safe_goal[side] - goal[side]) > 1e-4):
+                warnings_dict[keys[idx]] = {
+                    "original goal_pos": float(goal[side][idx]),
+                    "safe goal_pos": float(safe_goal[side][idx]),
+                }
+
+        if warnings_dict:
+            logger.warning(
+                "Relative goal position magnitude had to be clamped to be safe.\n"
+                f"{pformat(warnings_dict, indent=4)}"
+            )
+        return safe_goal
+
     def send_action(self, action: dict[str, Any]) -> dict[str, Any]:
         """Command arm to move to a target joint configuration.
 
@@ -308,55 +437,119 @@ class DualScorpionFollower(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
         
-        goal_pos = {key.removesuffix(".pos"): val for key, val in action.items() if key.endswith(".pos")}
+        # Gather the goal positions into one float32 vector per arm, NaN marking motors without a target
+        # 目標位置を腕ごとのベクトルにまとめる（目標のないモーターは NaN）
+        goal = {
+            "right": np.full(len(self._right_motors), np.nan, dtype=np.float32),
+            "left": np.full(len(self._left_motors), np.nan, dtype=np.float32),
+        }
+        for key, val in action.items():
+            route = self._action_key_route.get(key)
+            if route is not None:
+                side, idx = route
+                goal[side][idx] = val
 
         # Cap goal position when too far away from present position.
-        # /!\ Slower fps expected due to reading from the follower.
+        # The background snapshot is used when fresh enough, otherwise both arms are read again.
         # 現在の位置から離れすぎている場合は、目標位置をキャップします。
-        # /!\ フォロワーからの読み取りにより、fps が遅くなることが予想されます。
+        # バックグラウンドで読み取った現在位置が十分新しければそれを使い、古ければ再度読み取ります。
         if self.config.max_relative_target is not None:
-            right_present_pos = self.right_bus.sync_read("Present_Position")
-            left_present_pos = self.left_bus.sync_read("Present_Position")
+            now = time.monotonic()
+            if all(now - reader.latest_ts < self.config.present_reuse_s for reader in self._readers.values()):
+                present_pos = {side: reader.latest for side, reader in self._readers.items()}
+            else:
+                futures = {side: self._io_pool.submit(reader.read) for side, reader in self._readers.items()}
+                present_pos = {side: future.result() for side, future in futures.items()}
+
+            goal = self._clip_goal_position(goal, present_pos)
+
+        # Back to dicts only at the bus boundary, dropping the motors without a target. The returned action
+        # is filled in the same pass from the precomputed keys, so no key is formatted per call.
+        # バスへの書き込み用の辞書と戻り値の辞書を、事前計算したキーで一度に作成する
+        right_goal_pos, left_goal_pos, goal_pos = {}, {}, {}
+        for motors, keys, values, bus_goal_pos in (
+            (self._right_motors, self._right_pos_keys, goal["right"].tolist(), right_goal_pos),
+            (self._left_motors, self._left_pos_keys, goal["left"].tolist(), left_goal_pos),
+        ):
+            for motor, key, val in zip(motors, keys, values, strict=True):
+                if not math.isnan(val):
+                    bus_goal_pos[motor] = val
+                    goal_pos[key] = val
+
+        # Scatter the goal positions: the left packet goes out from the pool while the right one is written
+        # from this thread, so both USB transfers are in flight together without an extra thread hand-off.
+        left_future = self._io_pool.submit(
+            _call_locked, self._readers["left"].lock, self.left_bus.sync_write, "Goal_Position", left_goal_pos
+        )
+        with self._readers["right"].lock:
+            self.right_bus.sync_write("Goal_Position", right_goal_pos)
+        left_future.result()
+        return goal_pos
+    
+    def _action_sender(self, stop_event: threading.Event) -> None:
+        """
+        Send the actions put into the slot, stopping on the first error.
+        スロットのアクションを送信し、エラー時はスロットに渡して停止する
+        """
+        while not stop_event.is_set():
+            try:
+                action = self._action_slot.get(timeout=0.1)
+            except Empty:
+                continue
+
+            try:
+                self.send_action(action)
+            except Exception as e:
+                logger.error(f"Error sending action in background thread for {self}: {e}")
+                self._action_slot.fail(e)
+                break
+
+    def start_action_sender(self) -> LatestSlot:
+        """
+        Start the background action sender if needed and return the slot it sends from.
+        バックグラウンド送信スレッドを起動し、送信用スロットを返す
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
 
-            goal_present_pos = {
-                f"right_{key}": (g_pos, right_present_pos[key]) 
-                for key, g_pos in goal_pos.items() 
-                if key.startswith("right_")
-            }
-            goal_present_pos.update({
-                f"left_{key}": (g_pos, left_present_pos[key]) 
-                for key, g_pos in goal_pos.items() 
-                if key.startswith("left_")
-            })
-
-            goal_pos = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
-
-        # Send goal position to the arms
-        # 右腕用の目標位置を抽出
-        right_goal_pos = {
-            key.replace("right_", ""): val 
-            for key, val in goal_pos.items() 
-            if key.startswith("right_")
-        }
-        # 左腕用の目標位置を抽出
-        left_goal_pos = {
-            key.replace("left_", ""): val 
-            for key, val in goal_pos.items() 
-            if key.startswith("left_")
-        }
+        with self._sender_lock:
+            if self._sender_thread is None:
+                # Drop any action left over from a previous session / 前回のセッションのアクションを破棄
+                self._action_slot.clear()
+                self._sender_stop_event = threading.Event()
+                self._sender_thread = threading.Thread(
+                    target=self._action_sender,
+                    args=(self._sender_stop_event,),
+                    name=f"{self}_action_sender",
+                    daemon=True,
+                )
+                self._sender_thread.start()
+        return self._action_slot
+
+    def _stop_action_sender(self) -> None:
+        """Signals the background action sender to stop and waits for it to join."""
+        with self._sender_lock:
+            if self._sender_stop_event is not None:
+                self._sender_stop_event.set()
+            if self._sender_thread is not None:
+                self._sender_thread.join(timeout=2.0)
+
+            self._sender_thread = None
+            self._sender_stop_event = None
 
-        self.right_bus.sync_write("Goal_Position", right_goal_pos)
-        self.left_bus.sync_write("Goal_Position", left_goal_pos)
-        return {f"{motor}.pos": val for motor, val in goal_pos.items()}
-    
     def disconnect(self):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
+        self._stop_action_sender()
+        for reader in self._readers.values():
+            reader.stop()
         self.right_bus.disconnect(self.config.disable_torque_on_disconnect)
         self.left_bus.disconnect(self.config.disable_torque_on_disconnect)
         for cam in self.cameras.values():
             cam.disconnect()
+        self._connected = False
+        self._calibrated = None
 
         logger.info(f"{self} disconnected.")
     
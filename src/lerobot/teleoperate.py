@@ -119,6 +119,12 @@ def teleop_loop(
     teleop: Teleoperator, robot: Robot, fps: int, display_data: bool = False, duration: float | None = None
 ):
     display_len = max(len(key) for key in robot.action_features)
+    # Robots that can send actions from a background thread return a latest-only slot from
+    # `start_action_sender`: hand the action over instead of waiting for the motors, so a slow write never
+    # makes the loop fall behind the teleoperator. A failure to send is raised by the next `put`, which stops
+    # the loop like a failing `send_action`.
+    start_action_sender = getattr(robot, "start_action_sender", None)
+    action_slot = start_action_sender() if start_action_sender is not None else None
     start = time.perf_counter()
     while True:
         loop_start = time.perf_counter()
@@ -127,7 +133,10 @@ def teleop_loop(
             observation = robot.get_observation()
             log_rerun_data(observation, action)
 
-        robot.send_action(action)
+        if action_slot is not None:
+            action_slot.put(action)
+        else:
+            robot.send_action(action)
         dt_s = time.perf_counter() - loop_start
         busy_wait(1 / fps - dt_s)
 
@@ -29,4 +29,14 @@ class DualScorpionLeaderConfig(TeleoperatorConfig):
     right_arm_port: str  # Port for the right arm (e.g. "/dev/ttyACM1")
     left_arm_port: str  # Port for the left arm (e.g. "/dev/ttyACM3")
 
-    use_degrees: bool = False
\ No newline at end of file
+    use_degrees: bool = False
+
+    # Background reading of the arm buses (see `lerobot.motors.bus_reader.BusReader`): motors read per poll
+    # (`None` for all of them), and how old the arm state may get before reading it raises.
+    partial_read_size: int | None = None
+    max_state_age_s: float = 0.5
+
+    def __post_init__(self):
+        # Values above the number of motors read them all / モーター数を超える値は全モーター読み取りと同じ
+        if self.partial_read_size is not None and self.partial_read_size < 1:
+            raise ValueError(f"partial_read_size must be at least 1, got {self.partial_read_size}.")
@@ -17,9 +17,12 @@
 
 import logging
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
+from lerobot.motors.bus_reader import BusReader, check_registers, split_calibration
 from lerobot.motors.feetech import (
     FeetechMotorsBus,
     OperatingMode,
@@ -30,6 +33,7 @@ from .config_dual_scorpion_leader import DualScorpionLeaderConfig
 
 logger = logging.getLogger(__name__)
 
+
 class DualScorpionLeader(Teleoperator):
     """
     Dual Scorpion Leader Arm
@@ -44,19 +48,14 @@ class DualScorpionLeader(Teleoperator):
         """
         super().__init__(config)
         self.config = config
+        # Rendered once so the per-tick debug logs don't go through __str__ / デバッグログ用に名前を事前生成
+        self._name_repr = str(self)
         norm_mode_body = MotorNormMode.DEGREES if config.use_degrees else MotorNormMode.RANGE_M100_100
 
         # Separate calibration data for right and left arms / キャリブレーションデータを右腕と左腕用に分離
-        right_calibration = {
-            motor.replace("right_", ""): calib 
-            for motor, calib in self.calibration.items() 
-            if motor.startswith("right_")
-        }
-        left_calibration = {
-            motor.replace("left_", ""): calib 
-            for motor, calib in self.calibration.items() 
-            if motor.startswith("left_")
-        }
+        self._right_calibration, self._left_calibration = split_calibration(
+            self.calibration, ("right", "left")
+        )
 
         # Initialize right follower motors / 右腕のモーターバスの初期化
         self.right_bus = FeetechMotorsBus(
@@ -71,7 +70,7 @@ class DualScorpionLeader(Teleoperator):
                 "joint6": Motor(7, "sts3215", norm_mode_body),
                 "gripper": Motor(8, "sts3215", MotorNormMode.RANGE_0_100),
             },
-            calibration=right_calibration,
+            calibration=self._right_calibration,
         )
         # Initialize left follower motors / 左腕のモーターバスの初期化
         self.left_bus = FeetechMotorsBus(
@@ -86,21 +85,38 @@ class DualScorpionLeader(Teleoperator):
                 "joint6": Motor(7, "sts3215", norm_mode_body),
                 "gripper": Motor(8, "sts3215", MotorNormMode.RANGE_0_100),
             },
-            calibration=left_calibration,
+            calibration=self._left_calibration,
+        )
+
+        # The motor layout is fixed after construction, so the prefixed feature keys are built once.
+        # モーター構成は固定のため、接頭辞付きのキーを事前に作成しておく
+        self._right_motors = tuple(self.right_bus.motors)
+        self._left_motors = tuple(self.left_bus.motors)
+        self._right_pos_keys = tuple(f"right_{motor}.pos" for motor in self._right_motors)
+        self._left_pos_keys = tuple(f"left_{motor}.pos" for motor in self._left_motors)
+        # Right arm motors, then left arm motors, as a read-only view / 右腕のモーター、左腕のモーターの順
+        self._action_ft_frozen = MappingProxyType(
+            dict.fromkeys(self._right_pos_keys + self._left_pos_keys, float)
         )
 
+        # Present positions are polled by one background reader per bus / 現在位置はバスごとに別スレッドで読み取る
+        self._readers = {
+            "right": BusReader(self.right_bus, f"{self} right arm"),
+            "left": BusReader(self.left_bus, f"{self} left arm"),
+        }
+
+        # Connection and calibration status only change through connect/calibrate/disconnect, so they are
+        # tracked here rather than queried from both buses on each call.
+        self._connected = False
+        self._calibrated: bool | None = None  # unknown until read from the motors on connect
+
     @property
-    def action_features(self) -> dict[str, type]:
+    def action_features(self) -> Mapping[str, type]:
         """
         Returns the action features for the Dual Scorpion Leader Arm.
         アクション特徴を返す
         """
-        features = {}
-        # Right arm motors / 右腕のモーター
-        features.update({f"right_{motor}.pos": float for motor in self.right_bus.motors})
-        #  Left arm motors / 左腕のモーター
-        features.update({f"left_{motor}.pos": float for motor in self.left_bus.motors})
-        return features
+        return self._action_ft_frozen
     
     @property
     def feedback_features(self) -> dict[str, type]:
@@ -112,7 +128,7 @@ class DualScorpionLeader(Teleoperator):
         Check if the devices is connected.
         デバイスが接続されているかを確認する
         """
-        return self.right_bus.is_connected and self.left_bus.is_connected
+        return self._connected
     
     def connect(self, calibrate: bool = True) -> None:
         """
@@ -122,94 +138,113 @@ class DualScorpionLeader(Teleoperator):
         if self.is_connected:  # 既に接続されている場合はエラーを投げる
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
-        self.right_bus.connect()  # 右腕のモーターバスを接続
-        self.left_bus.connect()  # 左腕のモーターバスを接続
+        try:
+            self.right_bus.connect()  # 右腕のモーターバスを接続
+            self.left_bus.connect()  # 左腕のモーターバスを接続
 
-        if not self.is_calibrated and calibrate:  # キャリブレーションが必要な場合は実行
-            self.calibrate()
+            if not self.is_calibrated and calibrate:  # キャリブレーションが必要な場合は実行
+                self.calibrate()
 
-        self.configure()
+            self.configure()
+            for reader in self._readers.values():
+                reader.start(self.config.partial_read_size)
+            for reader in self._readers.values():
+                reader.wait_ready()
+        except BaseException:
+            # `disconnect` can't be called while not connected, so release what did connect here
+            # 接続に失敗した場合は、接続済みのバスとスレッドを解放してから例外を再送出する
+            self._release_partial_connection()
+            raise
+
+        self._connected = True
         logger.info(f"{self} connected.")
 
+    def _release_partial_connection(self) -> None:
+        """
+        Release whatever a failed `connect` did connect.
+        接続に失敗した際に、接続済みのバスとスレッドを解放する
+        """
+        for reader in self._readers.values():
+            reader.release()
+        self._calibrated = None
+
     @property
     def is_calibrated(self) -> bool:
         """
         Check if the devices is calibrated.
         キャリブレーションが完了しているかを確認する
         """
-        return self.right_bus.is_calibrated and self.left_bus.is_calibrated
+        if self._calibrated is None:
+            self._calibrated = self.right_bus.is_calibrated and self.left_bus.is_calibrated
+        return self._calibrated
     
     def calibrate(self) -> None:
         """
         Run calibration for the Dual Scorpion Leader Arm.
         キャリブレーションを実行する
         """
-        logger.info(f"\nRunning calibration for {self}")
-        self.right_bus.disable_torque()  # 右腕のトルクを無効化
-        self.left_bus.disable_torque()  # 左腕のトルクを無効化
-
-        for motor in self.right_bus.motors:
-            self.right_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-        for motor in self.left_bus.motors:
-            self.left_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-
-        self.calibration = {}
-        # Right arm calibration / 右腕のキャリブレーション 
-        input(f"Move RIGHT {self} to the middle of its range of motion and press ENTER....")
-        right_homing_offsets = self.right_bus.set_half_turn_homings()
-        print(
-            "Move all joints sequentially through their entire ranges "
-            "of motion.\nRecording positions. Press ENTER to stop..."
-        )
-        right_range_mins, right_range_maxes = self.right_bus.record_ranges_of_motion()
-        for motor, m in self.right_bus.motors.items():  # motor = "shoulder_pan", "shoulder_lift", ... | m = Motor instance
-            self.calibration[f"right_{motor}"] = MotorCalibration(
-                id=m.id,
-                drive_mode=0,
-                homing_offset=right_homing_offsets[motor],
-                range_min=right_range_mins[motor],
-                range_max=right_range_maxes[motor],
+        # Keep the background readers off the buses while calibrating / キャリブレーション中はバスを占有する
+        with self._readers["right"].lock, self._readers["left"].lock:
+            logger.info(f"\nRunning calibration for {self}")
+            self.right_bus.disable_torque()  # 右腕のトルクを無効化
+            self.left_bus.disable_torque()  # 左腕のトルクを無効化
+
+            self.right_bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
+            self.left_bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
+            check_registers(self.right_bus, {"Operating_Mode": OperatingMode.POSITION.value})
+            check_registers(self.left_bus, {"Operating_Mode": OperatingMode.POSITION.value})
+
+            self.calibration = {}
+            self._right_calibration, self._left_calibration = {}, {}
+            # Right arm calibration / 右腕のキャリブレーション 
+            input(f"Move RIGHT {self} to the middle of its range of motion and press ENTER....")
+            right_homing_offsets = self.right_bus.set_half_turn_homings()
+            print(
+                "Move all joints sequentially through their entire ranges "
+                "of motion.\nRecording positions. Press ENTER to stop..."
             )
+            right_range_mins, right_range_maxes = self.right_bus.record_ranges_of_motion()
+            for motor, m in self.right_bus.motors.items():  # motor = "shoulder_pan", "shoulder_lift", ... | m = Motor instance
+                calib = MotorCalibration(
+                    id=m.id,
+                    drive_mode=0,
+                    homing_offset=right_homing_offsets[motor],
+                    range_min=right_range_mins[motor],
+                    range_max=right_range_maxes[motor],
+                )
+                self.calibration[f"right_{motor}"] = calib
+                self._right_calibration[motor] = calib
 
-        # Left arm calibration / 左腕のキャリブレーション
-        input(f"Move LEFT {self} to the middle of its range of motion and press ENTER....")  
-        homing_offsets_left = self.left_bus.set_half_turn_homings()
-        print(
-            "Move all joints sequentially through their entire ranges "
-            "of motion.\nRecording positions. Press ENTER to stop..."
-        )
-        range_mins_left, range_maxes_left = self.left_bus.record_ranges_of_motion()
-        for motor, m in self.left_bus.motors.items():
-            self.calibration[f"left_{motor}"] = MotorCalibration(
-                id=m.id,
-                drive_mode=0,
-                homing_offset=homing_offsets_left[motor],
-                range_min=range_mins_left[motor],
-                range_max=range_maxes_left[motor],
+            # Left arm calibration / 左腕のキャリブレーション
+            input(f"Move LEFT {self} to the middle of its range of motion and press ENTER....")  
+            homing_offsets_left = self.left_bus.set_half_turn_homings()
+            print(
+                "Move all joints sequentially through their entire ranges "
+                "of motion.\nRecording positions. Press ENTER to stop..."
             )
+            range_mins_left, range_maxes_left = self.left_bus.record_ranges_of_motion()
+            for motor, m in self.left_bus.motors.items():
+                calib = MotorCalibration(
+                    id=m.id,
+                    drive_mode=0,
+                    homing_offset=homing_offsets_left[motor],
+                    range_min=range_mins_left[motor],
+                    range_max=range_maxes_left[motor],
+                )
+                self.calibration[f"left_{motor}"] = calib
+                self._left_calibration[motor] = calib
 
-        print("Saving calibration...")
+            print("Saving calibration...")
 
-        # error:
-        # self.right_bus.write_calibration(self.calibration)  # 右腕のキャリブレーションを保存
-        # self.left_bus.write_calibration(self.calibration)  # 左腕のキャリブレーションを保存
+            # error:
+            # self.right_bus.write_calibration(self.calibration)  # 右腕のキャリブレーションを保存
+            # self.left_bus.write_calibration(self.calibration)  # 左腕のキャリブレーションを保存
 
-        # キャリブレーションを保存する前に、右腕と左腕のキャリブレーションデータを分ける必要がある
-        # Extract calibration data for the right arm / 右腕用のキャリブレーションデータを抽出
-        right_calibration = {
-            motor.replace("right_", ""): calib
-            for motor, calib in self.calibration.items()
-            if motor.startswith("right_")
-        }
-        # Extract calibration data for the left arm / 左腕用のキャリブレーションデータを抽出
-        left_calibration = {
-            motor.replace("left_", ""): calib
-            for motor, calib in self.calibration.items()
-            if motor.startswith("left_")
-        }
-        self.right_bus.write_calibration(right_calibration)
-        self.left_bus.write_calibration(left_calibration)
+            # Each bus only takes the calibration of its own arm / 各バスには自分の腕のキャリブレーションのみを書き込む
+            self.right_bus.write_calibration(self._right_calibration)
+            self.left_bus.write_calibration(self._left_calibration)
 
+        self._calibrated = True
         self._save_calibration()  # キャリブレーションを保存
         print(f"Calibration saved to {self.calibration_fpath}")
 
@@ -218,23 +253,24 @@ class DualScorpionLeader(Teleoperator):
         Configure the motors for the Dual Scorpion Leader Arm.
         Dual Scorpion 双腕リーダーアームのモーターを設定する
         """
-        self.right_bus.disable_torque()  # 右腕のトルクの無効化
-        self.left_bus.disable_torque()  # 左腕のトルクの無効化
+        with self._readers["right"].lock, self._readers["left"].lock:
+            self.right_bus.disable_torque()  # 右腕のトルクの無効化
+            self.left_bus.disable_torque()  # 左腕のトルクの無効化
 
-        self.right_bus.configure_motors()  # 右腕のモーターを設定
-        self.left_bus.configure_motors()  # 左腕のモーターを設定
+            self.right_bus.configure_motors()  # 右腕のモーターを設定
+            self.left_bus.configure_motors()  # 左腕のモーターを設定
 
-        for motor in self.right_bus.motors:
-            self.right_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-        for motor in self.left_bus.motors:
-            self.left_bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
+            self.right_bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
+            self.left_bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
+            check_registers(self.right_bus, {"Operating_Mode": OperatingMode.POSITION.value})
+            check_registers(self.left_bus, {"Operating_Mode": OperatingMode.POSITION.value})
 
     def setup_motors(self) -> None:
-        for motor in reversed(self.right_bus.motors):
+        for motor in reversed(self._right_motors):
             input(f"Connect the controller board to the '{motor}' motor only and press enter.")
             self.right_bus.setup_motor(motor)
             print(f"'{motor}' motor id set to {self.right_bus.motors[motor].id}")
-        for motor in reversed(self.left_bus.motors):
+        for motor in reversed(self._left_motors):
             input(f"Connect the controller board to the '{motor}' motor only and press enter.")
             self.left_bus.setup_motor(motor)
             print(f"'{motor}' motor id set to {self.left_bus.motors[motor].id}")
@@ -244,15 +280,22 @@ class DualScorpionLeader(Teleoperator):
         Read the current action from the Dual Scorpion Leader Arm.
         アクションを取得する
         """
-        start = time.perf_counter()
-        action_right = self.right_bus.sync_read("Present_Position")
-        action_left = self.left_bus.sync_read("Present_Position")
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+        for reader in self._readers.values():
+            reader.check_fresh(self.config.max_state_age_s)
+
+        # The timing is only taken when it will actually be logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            start_ns = time.monotonic_ns()
+        action_right, action_left = self._readers["right"].latest, self._readers["left"].latest
         
-        action = {f"right_{motor}.pos": val for motor, val in action_right.items()}
-        action.update({f"left_{motor}.pos": val for motor, val in action_left.items()})
+        action = dict(zip(self._right_pos_keys, action_right.tolist(), strict=True))
+        action.update(zip(self._left_pos_keys, action_left.tolist(), strict=True))
         
-        dt_ms = (time.perf_counter() - start) * 1e3
-        logger.debug(f"{self} read action: {dt_ms:.1f}ms")
+        if debug:
+            logger.debug("%s read action: %.1fms", self._name_repr, (time.monotonic_ns() - start_ns) / 1e6)
         return action
     
     def send_feedback(self, feedback: dict[str, float]) -> None:
@@ -260,9 +303,13 @@ class DualScorpionLeader(Teleoperator):
     
     def disconnect(self) -> None:
         if not self.is_connected:
-            DeviceNotConnectedError(f"{self} is not connected.")
+            raise DeviceNotConnectedError(f"{self} is not connected.")
     
+        for reader in self._readers.values():
+            reader.stop()
         self.right_bus.disconnect()
         self.left_bus.disconnect()
+        self._connected = False
+        self._calibrated = None
 
         logger.info(f"{self} disconnected.")
@@ -16,7 +16,7 @@
 
 import platform
 from contextlib import suppress
-from queue import Empty
+from queue import Empty, Full, Queue as ThreadQueue
 from typing import Any
 
 from torch.multiprocessing import Queue
@@ -50,3 +50,41 @@ def get_last_item_from_queue(queue: Queue, block=True, timeout: float = 0.1) ->
             item = queue.get_nowait()
 
     return item
+
+
+class LatestSlot:
+    """
+    Thread-safe single-item slot with latest-only semantics: `put` never blocks and replaces an item that
+    has not been consumed yet, so a consumer slower than its producer always picks up the freshest item
+    instead of working through a backlog of stale ones.
+    A consumer that can't go on calls `fail`, so that the error reaches the producer on its next `put`.
+    """
+
+    def __init__(self):
+        self._queue: ThreadQueue = ThreadQueue(maxsize=1)
+        self._error: BaseException | None = None
+
+    def put(self, item: Any) -> None:
+        """Puts `item`, replacing the pending one. Raises the consumer's error if it has failed."""
+        if self._error is not None:
+            raise self._error
+        while True:
+            with suppress(Empty):
+                self._queue.get_nowait()
+            with suppress(Full):
+                self._queue.put_nowait(item)
+                return
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Takes the item out of the slot. Raises `queue.Empty` if there is none within `timeout`."""
+        return self._queue.get(block=block, timeout=timeout)
+
+    def fail(self, error: BaseException) -> None:
+        """Records that the consumer stopped because of `error`, which the next `put` raises."""
+        self._error = error
+
+    def clear(self) -> None:
+        """Drops the pending item and any recorded consumer error."""
+        self._error = None
+        with suppress(Empty):
+            self._queue.get_nowait()
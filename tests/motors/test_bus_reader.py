@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from lerobot.errors import DeviceNotConnectedError
+from lerobot.motors import MotorCalibration
+from lerobot.motors.bus_reader import BusReader, check_registers, split_calibration
+
+MOTORS = ("joint0", "joint1", "joint2", "gripper")
+
+
+@pytest.fixture
+def bus():
+    bus = MagicMock(name="BusMock")
+    bus.motors = dict.fromkeys(MOTORS)
+    bus.is_connected = True
+    bus.sync_read.return_value = {motor: float(idx) for idx, motor in enumerate(MOTORS, 1)}
+    return bus
+
+
+@pytest.fixture
+def reader(bus):
+    reader = BusReader(bus, "test arm")
+    yield reader
+    reader.stop()
+
+
+def test_snapshot_follows_motor_order(reader):
+    reader.start()
+    reader.wait_ready()
+
+    assert reader.is_running
+    assert reader.latest.tolist() == [1.0, 2.0, 3.0, 4.0]
+    reader.check_fresh(max_age_s=0.5)
+
+
+def test_stop(reader):
+    reader.start()
+    reader.wait_ready()
+    reader.stop()
+
+    assert not reader.is_running
+    with pytest.raises(ConnectionError):
+        reader.check_fresh(max_age_s=0.5)
+
+
+def test_check_fresh_raises_when_reads_keep_failing(reader, bus):
+    reader.start()
+    reader.wait_ready()
+
+    bus.sync_read.side_effect = ConnectionError("no status packet")
+    time.sleep(0.1)
+
+    assert reader.is_running
+    with pytest.raises(ConnectionError) as exc_info:
+        reader.check_fresh(max_age_s=0.05)
+    assert exc_info.value.__cause__ is reader.error
+
+
+def test_stops_when_bus_is_disconnected(reader, bus):
+    reader.start()
+    reader.wait_ready()
+
+    bus.sync_read.side_effect = DeviceNotConnectedError("disconnected")
+    time.sleep(0.05)
+
+    assert not reader.is_running
+
+
+def test_wait_ready_times_out(reader, bus):
+    bus.sync_read.side_effect = ConnectionError("no status packet")
+    reader.start()
+
+    with pytest.raises(TimeoutError):
+        reader.wait_ready(timeout=0.05)
+
+
+def test_read(reader):
+    assert reader.read().tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_release_disconnects_bus(reader, bus):
+    reader.start()
+    reader.wait_ready()
+    reader.release(disable_torque=False)
+
+    assert not reader.is_running
+    bus.disconnect.assert_called_once_with(False)
+
+
+def test_split_calibration_skips_unprefixed_keys():
+    calib = MotorCalibration(id=1, drive_mode=0, homing_offset=0, range_min=0, range_max=4095)
+    calibration = {"shoulder_pan": calib, "right_joint0": calib, "left_gripper": calib}
+
+    right, left = split_calibration(calibration, ("right", "left"))
+
+    assert right == {"joint0": calib}
+    assert left == {"gripper": calib}
+
+
+def test_check_registers_raises_on_mismatch(bus):
+    bus.sync_read.return_value = {"joint0": 16, "joint1": 32}
+
+    with pytest.raises(RuntimeError, match="joint1"):
+        check_registers(bus, {"P_Coefficient": 16})
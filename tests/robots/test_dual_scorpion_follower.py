@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lerobot.robots.dual_scorpion_follower import (
+    DualScorpionFollower,
+    DualScorpionFollowerConfig,
+)
+
+
+def _make_bus_mock(name: str) -> MagicMock:
+    """Return a bus mock with just the attributes used by the robot."""
+    bus = MagicMock(name=name)
+    bus.is_connected = False
+
+    def _connect():
+        bus.is_connected = True
+
+    def _disconnect(_disable=True):
+        bus.is_connected = False
+
+    bus.connect.side_effect = _connect
+    bus.disconnect.side_effect = _disconnect
+
+    @contextmanager
+    def _dummy_cm():
+        yield
+
+    bus.torque_disabled.side_effect = _dummy_cm
+
+    return bus
+
+
+@pytest.fixture
+def follower():
+    # Right bus values start at 1, left bus values at 101, so the arms can't be mixed up.
+    bus_mocks = iter([(_make_bus_mock("RightBusMock"), 1), (_make_bus_mock("LeftBusMock"), 101)])
+
+    def _bus_side_effect(*_args, **kwargs):
+        bus_mock, offset = next(bus_mocks)
+        bus_mock.motors = kwargs["motors"]
+        motors_order: list[str] = list(bus_mock.motors)
+
+        bus_mock.sync_read.return_value = {motor: idx for idx, motor in enumerate(motors_order, offset)}
+        bus_mock.sync_write.return_value = None
+        bus_mock.write.return_value = None
+        bus_mock.disable_torque.return_value = None
+        bus_mock.enable_torque.return_value = None
+        bus_mock.is_calibrated = True
+        return bus_mock
+
+    with (
+        patch(
+            "lerobot.robots.dual_scorpion_follower.dual_scorpion_follower.FeetechMotorsBus",
+            side_effect=_bus_side_effect,
+        ),
+        patch.object(DualScorpionFollower, "configure", lambda self: None),
+    ):
+        cfg = DualScorpionFollowerConfig(right_arm_port="/dev/null", left_arm_port="/dev/null")
+        robot = DualScorpionFollower(cfg)
+        yield robot
+        if robot.is_connected:
+            robot.disconnect()
+
+
+def test_connect_disconnect(follower):
+    assert not follower.is_connected
+
+    follower.connect()
+    assert follower.is_connected
+    # The action sender only runs once the action slot is used
+    assert follower._sender_thread is None
+
+    follower.disconnect()
+    assert not follower.is_connected
+
+
+def test_get_observation(follower):
+    follower.connect()
+    obs = follower.get_observation()
+
+    expected_keys = {f"right_{m}.pos" for m in follower.right_bus.motors}
+    expected_keys |= {f"left_{m}.pos" for m in follower.left_bus.motors}
+    assert set(obs.keys()) == expected_keys
+
+    for idx, motor in enumerate(follower.right_bus.motors, 1):
+        assert obs[f"right_{motor}.pos"] == idx
+    for idx, motor in enumerate(follower.left_bus.motors, 101):
+        assert obs[f"left_{motor}.pos"] == idx
+
+
+def test_send_action(follower):
+    follower.connect()
+
+    action = {f"right_{m}.pos": i * 10 for i, m in enumerate(follower.right_bus.motors, 1)}
+    action.update({f"left_{m}.pos": -i * 10 for i, m in enumerate(follower.left_bus.motors, 1)})
+    returned = follower.send_action(action)
+
+    assert returned == action
+
+    right_goal_pos = {m: (i + 1) * 10 for i, m in enumerate(follower.right_bus.motors)}
+    left_goal_pos = {m: -(i + 1) * 10 for i, m in enumerate(follower.left_bus.motors)}
+    follower.right_bus.sync_write.assert_called_once_with("Goal_Position", right_goal_pos)
+    follower.left_bus.sync_write.assert_called_once_with("Goal_Position", left_goal_pos)
+
+
+def test_send_action_clips_to_present_position(follower):
+    follower.config.max_relative_target = 5.0
+    follower.connect()
+
+    action = {f"right_{m}.pos": 100.0 for m in follower.right_bus.motors}
+    action.update({f"left_{m}.pos": 0.0 for m in follower.left_bus.motors})
+    returned = follower.send_action(action)
+
+    for idx, motor in enumerate(follower.right_bus.motors, 1):
+        assert returned[f"right_{motor}.pos"] == idx + 5.0
+    for idx, motor in enumerate(follower.left_bus.motors, 101):
+        assert returned[f"left_{motor}.pos"] == idx - 5.0
+
+
+def test_action_slot_is_sent_in_background(follower):
+    follower.connect()
+
+    action = {f"right_{m}.pos": 1.0 for m in follower.right_bus.motors}
+    action.update({f"left_{m}.pos": 2.0 for m in follower.left_bus.motors})
+    follower.start_action_sender().put(action)
+
+    deadline = time.monotonic() + 2.0
+    while follower.left_bus.sync_write.call_count == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    follower.right_bus.sync_write.assert_called_once_with(
+        "Goal_Position", dict.fromkeys(follower.right_bus.motors, 1.0)
+    )
+    follower.left_bus.sync_write.assert_called_once_with(
+        "Goal_Position", dict.fromkeys(follower.left_bus.motors, 2.0)
+    )
+
+
+def test_start_action_sender_starts_one_sender(follower):
+    follower.connect()
+
+    action_slot = follower.start_action_sender()
+    sender_thread = follower._sender_thread
+
+    assert follower.start_action_sender() is action_slot
+    assert follower._sender_thread is sender_thread
+
+
+def test_get_observation_raises_when_bus_reads_keep_failing(follower):
+    follower.config.max_state_age_s = 0.05
+    follower.connect()
+
+    follower.right_bus.sync_read.side_effect = ConnectionError("no status packet")
+    time.sleep(0.2)
+
+    with pytest.raises(ConnectionError):
+        follower.get_observation()
+
+
+def test_partial_reads_date_snapshot_by_oldest_motor(follower):
+    follower.config.partial_read_size = 1
+    follower.connect()
+
+    # From now on only joint0 ever answers, so every other motor keeps its last full reading
+    follower.right_bus.sync_read.return_value = {"joint0": 0.0}
+    time.sleep(0.01)
+    oldest_ts = follower._readers["right"].latest_ts
+    time.sleep(0.05)
+
+    assert follower._readers["right"].latest_ts == oldest_ts
+    assert time.monotonic() - oldest_ts > follower.config.present_reuse_s
+
+
+def test_failed_connect_releases_buses_and_readers(follower):
+    follower.left_bus.sync_read.side_effect = ConnectionError("no status packet")
+
+    with pytest.raises(TimeoutError):
+        follower.connect()
+
+    assert not follower.is_connected
+    assert not follower.right_bus.is_connected
+    assert not follower.left_bus.is_connected
+    assert not any(reader.is_running for reader in follower._readers.values())
+
+
+def test_action_slot_raises_send_errors(follower):
+    follower.connect()
+    follower.right_bus.sync_write.side_effect = ConnectionError("port closed")
+
+    action_slot = follower.start_action_sender()
+    action_slot.put({f"right_{m}.pos": 1.0 for m in follower.right_bus.motors})
+    follower._sender_thread.join(timeout=2.0)
+
+    with pytest.raises(ConnectionError):
+        action_slot.put({})
+
+
+def test_partial_reads_merge_into_snapshot(follower):
+    follower.config.partial_read_size = 2
+    follower.connect()
+
+    bus = follower.right_bus
+    new_positions = {motor: 1000.0 + idx for idx, motor in enumerate(bus.motors)}
+    bus.sync_read.reset_mock()
+    bus.sync_read.side_effect = lambda data_name, motors=None: {m: new_positions[m] for m in motors}
+    time.sleep(0.1)
+
+    # Every poll after the first full read asks for the `partial_read_size` most stale motors only
+    requested = [call.args[1] for call in bus.sync_read.call_args_list]
+    assert requested and all(len(motors) == 2 for motors in requested)
+    # ...and every motor still gets refreshed, merged into the snapshot of the arm
+    assert {motor for motors in requested for motor in motors} == set(bus.motors)
+    obs = follower.get_observation()
+    for motor, value in new_positions.items():
+        assert obs[f"right_{motor}.pos"] == value
+
+
+def test_send_action_clips_with_per_motor_targets(follower):
+    right_motors, left_motors = list(follower.right_bus.motors), list(follower.left_bus.motors)
+    # Only part of the motors get a goal, so only they need a cap
+    follower.config.max_relative_target = {f"right_{right_motors[0]}": 5.0, f"left_{left_motors[0]}": 2.0}
+    follower.connect()
+
+    action = {f"right_{right_motors[0]}.pos": 100.0, f"left_{left_motors[0]}.pos": 0.0}
+    returned = follower.send_action(action)
+
+    assert returned == {f"right_{right_motors[0]}.pos": 1 + 5.0, f"left_{left_motors[0]}.pos": 101 - 2.0}
+
+    with pytest.raises(ValueError):
+        follower.send_action({f"right_{right_motors[1]}.pos": 100.0})
+
+
+def test_config_rejects_non_positive_partial_read_size():
+    with pytest.raises(ValueError):
+        DualScorpionFollowerConfig(right_arm_port="/dev/null", left_arm_port="/dev/null", partial_read_size=0)
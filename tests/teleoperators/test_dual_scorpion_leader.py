@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lerobot.errors import DeviceNotConnectedError
+from lerobot.teleoperators.dual_scorpion_leader import (
+    DualScorpionLeader,
+    DualScorpionLeaderConfig,
+)
+
+
+def _make_bus_mock(name: str) -> MagicMock:
+    """Return a bus mock with just the attributes used by the teleoperator."""
+    bus = MagicMock(name=name)
+    bus.is_connected = False
+
+    def _connect():
+        bus.is_connected = True
+
+    def _disconnect(_disable=True):
+        bus.is_connected = False
+
+    bus.connect.side_effect = _connect
+    bus.disconnect.side_effect = _disconnect
+
+    return bus
+
+
+@pytest.fixture
+def leader():
+    # Right bus values start at 1, left bus values at 101, so the arms can't be mixed up.
+    bus_mocks = iter([(_make_bus_mock("RightBusMock"), 1), (_make_bus_mock("LeftBusMock"), 101)])
+
+    def _bus_side_effect(*_args, **kwargs):
+        bus_mock, offset = next(bus_mocks)
+        bus_mock.motors = kwargs["motors"]
+        motors_order: list[str] = list(bus_mock.motors)
+
+        bus_mock.sync_read.return_value = {motor: idx for idx, motor in enumerate(motors_order, offset)}
+        bus_mock.is_calibrated = True
+        return bus_mock
+
+    with (
+        patch(
+            "lerobot.teleoperators.dual_scorpion_leader.dual_scorpion_leader.FeetechMotorsBus",
+            side_effect=_bus_side_effect,
+        ),
+        patch.object(DualScorpionLeader, "configure", lambda self: None),
+    ):
+        cfg = DualScorpionLeaderConfig(right_arm_port="/dev/null", left_arm_port="/dev/null")
+        teleop = DualScorpionLeader(cfg)
+        yield teleop
+        if teleop.is_connected:
+            teleop.disconnect()
+
+
+def test_connect_disconnect(leader):
+    assert not leader.is_connected
+
+    leader.connect()
+    assert leader.is_connected
+    assert all(reader.is_running for reader in leader._readers.values())
+
+    leader.disconnect()
+    assert not leader.is_connected
+    assert not any(reader.is_running for reader in leader._readers.values())
+    assert not leader.right_bus.is_connected
+    assert not leader.left_bus.is_connected
+
+
+def test_get_action(leader):
+    leader.connect()
+    action = leader.get_action()
+
+    assert list(action) == list(leader.action_features)
+    for idx, motor in enumerate(leader.right_bus.motors, 1):
+        assert action[f"right_{motor}.pos"] == idx
+    for idx, motor in enumerate(leader.left_bus.motors, 101):
+        assert action[f"left_{motor}.pos"] == idx
+
+
+def test_get_action_not_connected(leader):
+    with pytest.raises(DeviceNotConnectedError):
+        leader.get_action()
+
+
+def test_disconnect_not_connected(leader):
+    with pytest.raises(DeviceNotConnectedError):
+        leader.disconnect()
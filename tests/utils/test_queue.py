@@ -16,11 +16,12 @@
 
 import threading
 import time
-from queue import Queue
+from queue import Empty, Queue
 
+import pytest
 from torch.multiprocessing import Queue as TorchMPQueue
 
-from lerobot.utils.queue import get_last_item_from_queue
+from lerobot.utils.queue import LatestSlot, get_last_item_from_queue
 
 
 def test_get_last_item_single_item():
@@ -164,3 +165,27 @@ def test_get_last_item_blocking_waits_for_item():
 
     assert result == ["item2"]
     assert queue.empty()
+
+
+def test_latest_slot_put_replaces_unconsumed_item():
+    """Test that a new item replaces the one nobody has taken yet."""
+    slot = LatestSlot()
+    slot.put("stale")
+    slot.put("latest")
+
+    assert slot.get(block=False) == "latest"
+    with pytest.raises(Empty):
+        slot.get(block=False)
+
+
+def test_latest_slot_put_raises_consumer_error():
+    """Test that a failed consumer's error reaches the producer, until the slot is cleared."""
+    slot = LatestSlot()
+    slot.fail(ConnectionError("port closed"))
+
+    with pytest.raises(ConnectionError):
+        slot.put("item")
+
+    slot.clear()
+    slot.put("item")
+    assert slot.get(block=False) == "item"